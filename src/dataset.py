@@ -5,6 +5,10 @@ from pathlib import Path
 from src.task import TransactionScheduleTask
 
 
+# Translation table removing all brackets from a string.
+_BRACKETS = str.maketrans('', '', '[]')
+
+
 @dataclass
 class Dataset:
     """Container for Transaction Scheduling Tasks
@@ -28,9 +32,9 @@ def read_dataset(path: Path) -> Dataset:
     described elements are separared by an empty space. Spaces must not be used
     for anything else within the file. The first element represents the lengths
     comma separated. The second element represents the conflicts in a two
-    dimensional array, also comma separated. The last element represents an
-    optimal solution, which is given by a one dimensional array which is comma
-    separated as well.
+    dimensional array, also comma separated, which must be symmetric. The last
+    element represents an optimal solution, which is given by a one
+    dimensional array which is comma separated as well.
 
     Args:
         path: Location of the file to read the dataset from.
@@ -45,20 +49,24 @@ def read_dataset(path: Path) -> Dataset:
     tasks = []
 
     with path.open('r') as file:
-        for id, line in enumerate(file.readlines()):
-            lengths, conflicts, solution = line.split(' ')
+        for id, line in enumerate(file):
+            lengths, conflicts, solution = line.split(' ', 2)
 
-            lengths = lengths.replace('[', '').replace(']', '')
+            lengths = lengths.translate(_BRACKETS)
             lengths = np.fromstring(lengths, dtype=np.float64, sep=',')
 
-            tmp = []
-            for arr in conflicts.split('],['):
-                arr = arr.replace('[', '').replace(']', '')
-                arr = np.fromstring(arr, dtype=np.uint8, sep=',')
-                tmp.append(arr)
-            conflicts = np.array(tmp)
-
-            solution = solution.replace('[', '').replace(']', '')
+            conflicts = np.array([
+                np.fromstring(
+                    arr.translate(_BRACKETS),
+                    dtype=np.uint8,
+                    sep=','
+                )
+                for arr in conflicts.split('],[')
+            ])
+            if not np.array_equal(conflicts, conflicts.T):
+                raise ValueError('Conflicts are not symmetric: ', id)
+
+            solution = solution.translate(_BRACKETS)
             solution = np.fromstring(solution, dtype=np.uint8, sep=',')
 
             tasks.append(TransactionScheduleTask(
@@ -2,6 +2,9 @@ from pydantic import BaseModel, field_validator
 from typing import List, Type
 
 
+_WRITE_BUFFER_SIZE = 1 << 20
+
+
 class DataModel(BaseModel):
     """Representation of the data for easy reading and writing to disk.
 
@@ -49,6 +52,42 @@ def append_data_to_file(file_path: str, string: str) -> None:
         file.write(string + '\n')
 
 
+class JsonLinesWriter:
+    """Context manager to append multiple lines to a file.
+
+    In contrast to `append_data_to_file`, the file is kept open for the
+    duration of the context and the lines are written in buffered batches.
+
+    Attributes:
+        file_path: Path to the file.
+    """
+
+    def __init__(self, file_path: str) -> None:
+        self.file_path = file_path
+        self._file = None
+
+    def __enter__(self) -> "JsonLinesWriter":
+        self._file = open(
+            self.file_path,
+            'a',
+            newline='',
+            buffering=_WRITE_BUFFER_SIZE
+        )
+        return self
+
+    def __exit__(self, *args) -> None:
+        self._file.close()
+        self._file = None
+
+    def write(self, string: str) -> None:
+        """Append a string as a new line to the file.
+
+        Args:
+            string: String to be appended.
+        """
+        self._file.write(string + '\n')
+
+
 def read_json_lines_file_to_pydantic(
         file_path: str,
         model: Type[BaseModel]
@@ -64,7 +103,6 @@ def read_json_lines_file_to_pydantic(
     """
     entries = []
     with open(file_path, 'r') as file:
-        for line in file.readlines():
-            entry = model.model_validate_json(line)
-            entries.append(entry)
+        for line in file:
+            entries.append(model.model_validate_json(line))
     return entries
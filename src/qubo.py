@@ -1,6 +1,7 @@
+import math
 import numpy as np
 
-from pyqubo import Binary
+from collections import defaultdict
 from qiskit_optimization import QuadraticProgram
 from src.task import TransactionScheduleTask
 from typing import Dict, Optional, Tuple
@@ -57,91 +58,187 @@ def build_discrete_qubo(
         time_step_length = task.estimate_execution_time()/number_time_steps
 
     discrete_lengths = np.ceil(task.lengths/time_step_length).astype(int)
-    discrete_execution_length = np.ceil(
+    discrete_execution_length = math.ceil(
         task.estimate_execution_time(lengths=discrete_lengths)
-    ).astype(int)
+    )
     max_start_times = discrete_execution_length - discrete_lengths
 
-    transaction_idxs = list(range(1, task.num_transactions+1))
-    machine_idxs = list(range(1, task.num_machines+1))
-    start_times = lambda idx: range(max_start_times[idx]+1)
+    # Bind plain Python lists, as indexing them is faster than indexing NumPy
+    # arrays within the loops below. All indices start from 0.
+    dl = discrete_lengths.tolist()
+    mst = max_start_times.tolist()
+    start_times = [range(max_start_time+1) for max_start_time in mst]
+    transaction_idxs = range(task.num_transactions)
+    machine_idxs = range(task.num_machines)
 
     # 1. Build Hamiltonian
-    def b_var(transaction, machine, time) -> Binary:
-        return Binary(f'{transaction}-{machine}-{time}')
+    # Every term is a product of at most two binary variables. Therefore, the
+    # terms are accumulated directly into a QUBO dictionary instead of
+    # compiling a symbolic expression. Keys are ordered lexicographically.
+    # The variable names are formatted once and looked up by
+    # names[transaction][machine][start_time] or, for the blocking
+    # constraint, by their packed index in flat_names. The variable names
+    # start counting transactions and machines from 1.
+    num_start_times = max(mst) + 1
+    flat_names = [None]*(
+        task.num_transactions*task.num_machines*num_start_times)
+    names = []
+    for t_idx in transaction_idxs:
+        t_names = []
+        for m_idx in machine_idxs:
+            m_names = [f'{t_idx+1}-{m_idx+1}-{start_time}'
+                       for start_time in start_times[t_idx]]
+            packed_idx = (t_idx*task.num_machines + m_idx)*num_start_times
+            flat_names[packed_idx:packed_idx+len(m_names)] = m_names
+            t_names.append(m_names)
+        names.append(t_names)
+
+    qubo = defaultdict(float)
+    offset = 0.0
+
+    def add_term(var_a: str, var_b: str, value: float) -> None:
+        if var_a > var_b:
+            var_a, var_b = var_b, var_a
+        qubo[(var_a, var_b)] += value
 
     # 1.1 Ensure each transaction starts exactly once.
-    A = 0
+    # (sum(x_i) - 1)**2 expands to -sum(x_i) + 2*sum_{i<j}(x_i*x_j) + 1 as
+    # x_i**2 == x_i for binary variables.
     for t_idx in transaction_idxs:
-        a = -1
-        for m_idx in machine_idxs:
-            for start_time in start_times(t_idx-1):
-                a += b_var(t_idx, m_idx, start_time)
-        A += a**2
-
-    # # 1.2 Ensure transactions do not run at the same time on one machine.
-    B = 0
-    for m_idx in machine_idxs:
-        for t_idx in transaction_idxs[:-1]:
-            for start_time in start_times(t_idx-1):
-                for remaining_t_idx in transaction_idxs[t_idx:]:
-                    q = max(
-                        0,
-                        start_time - discrete_lengths[remaining_t_idx-1]+1
-                    )
-                    p = min(
-                        start_time + discrete_lengths[t_idx-1]-1,
-                        max_start_times[remaining_t_idx-1]
+        variables = [var for m_vars in names[t_idx] for var in m_vars]
+        offset += 1
+        for i, var in enumerate(variables):
+            add_term(var, var, -1)
+            for other_var in variables[i+1:]:
+                add_term(var, other_var, 2)
+
+    # 1.2 Ensure transactions do not run at the same time on one machine.
+    for t_idx in transaction_idxs:
+        for remaining_t_idx in transaction_idxs[t_idx+1:]:
+            overlaps = _overlapping_start_times(
+                dl[t_idx],
+                mst[t_idx],
+                dl[remaining_t_idx],
+                mst[remaining_t_idx]
+            ).tolist()
+            for m_idx in machine_idxs:
+                names_a = names[t_idx][m_idx]
+                names_b = names[remaining_t_idx][m_idx]
+                for start_time, invalid_start_time in overlaps:
+                    add_term(
+                        names_a[start_time],
+                        names_b[invalid_start_time],
+                        1
                     )
-                    for invalid_start_time in range(q, p+1):
-                        B = (
-                            B
-                            + b_var(t_idx, m_idx, start_time)
-                            * b_var(remaining_t_idx, m_idx, invalid_start_time)
-                        )
 
     # 1.3 Avoid blocking transactions.
-    C = 0
-    conflicts_list = np.column_stack(np.where(task.conflicts == 1))
-    sorted_conflicts_list = np.sort(conflicts_list, axis=1)
-    unique_conflicts_list = np.unique(sorted_conflicts_list, axis=0) + 1
+    # Conflicts are symmetric, so each pair is taken once from the upper
+    # triangle.
+    unique_conflicts_list = np.argwhere(np.triu(task.conflicts, k=1) == 1)
 
-    for t_idx_a, t_idx_b in unique_conflicts_list:
-        for m_idx in machine_idxs:
-            for start_time in start_times(t_idx_a-1):
-                for remaining_m_idx in machine_idxs:
-                    if m_idx == remaining_m_idx:
-                        continue
-                    q = max(0, start_time - discrete_lengths[t_idx_b-1]+1)
-                    p = min(
-                        start_time + discrete_lengths[t_idx_a-1]-1,
-                        max_start_times[t_idx_b-1]
-                    )
-                    for invalid_start_time in range(q, p+1):
-                        C = (
-                            C
-                            + b_var(t_idx_a, m_idx, start_time)
-                            * b_var(
-                                t_idx_b,
-                                remaining_m_idx,
-                                invalid_start_time
-                            )
-                        )
+    pair_idxs_a, pair_idxs_b = _enumerate_blocking_pairs(
+        unique_conflicts=unique_conflicts_list,
+        num_machines=task.num_machines,
+        discrete_lengths=discrete_lengths,
+        max_start_times=max_start_times
+    )
+    for idx_a, idx_b in zip(pair_idxs_a.tolist(), pair_idxs_b.tolist()):
+        add_term(flat_names[idx_a], flat_names[idx_b], 1)
 
     # 1.4 Ensure optimal solutions are selected.
-    D = 0
     machines = task.num_machines+1
+    w1 = machines**discrete_execution_length
     for t_idx in transaction_idxs:
         for m_idx in machine_idxs:
-            for start_time in start_times(t_idx-1):
-                w1 = machines**discrete_execution_length
-                w2 = machines**(start_time + discrete_lengths[t_idx-1] - 1)
+            for start_time in start_times[t_idx]:
+                w2 = machines**(start_time + dl[t_idx] - 1)
                 w = w2/w1
-                D += b_var(t_idx, m_idx, start_time)*w
+                var = names[t_idx][m_idx][start_time]
+                add_term(var, var, w)
+
+    return dict(qubo), offset
 
-    qubo = A + B + C + D
-    model = qubo.compile()
-    return model.to_qubo()
+
+def _overlapping_start_times(
+        length_a: int,
+        max_start_time_a: int,
+        length_b: int,
+        max_start_time_b: int
+        ) -> np.ndarray:
+    """Enumerate start time pairs for which two transactions overlap.
+
+    Args:
+        length_a: Discrete length of the first transaction.
+        max_start_time_a: Latest possible start time of the first transaction.
+        length_b: Discrete length of the second transaction.
+        max_start_time_b: Latest possible start time of the second
+            transaction.
+
+    Returns:
+        2D-Array where each row contains a start time of the first transaction
+            and a start time of the second transaction that overlap.
+    """
+    start_times_a = np.arange(max_start_time_a+1)[:, None]
+    start_times_b = np.arange(max_start_time_b+1)[None, :]
+    mask = (
+        (start_times_b >= start_times_a - length_b + 1)
+        & (start_times_b <= start_times_a + length_a - 1)
+    )
+    return np.argwhere(mask)
+
+
+def _enumerate_blocking_pairs(
+        unique_conflicts: np.ndarray,
+        num_machines: int,
+        discrete_lengths: np.ndarray,
+        max_start_times: np.ndarray
+        ) -> Tuple[np.ndarray, np.ndarray]:
+    """Enumerate variable pairs that run conflicting transactions in parallel.
+
+    A variable (transaction, machine, start_time) is identified by the packed
+    index (transaction*num_machines + machine)*(max(max_start_times)+1)
+    + start_time with all components starting from 0.
+
+    Args:
+        unique_conflicts: 2D-Array containing each pair of conflicting
+            transactions once.
+        num_machines: Number of available machines.
+        discrete_lengths: Discrete length of each transaction.
+        max_start_times: Latest possible start time of each transaction.
+
+    Returns:
+        Tuple containing the packed indices of the
+            [0]: first variable of each pair.
+            [1]: second variable of each pair.
+    """
+    num_start_times = max_start_times.max() + 1
+    machine_pairs = np.array([
+        (machine, other_machine)
+        for machine in range(num_machines)
+        for other_machine in range(num_machines)
+        if machine != other_machine
+    ], dtype=np.int64).reshape(-1, 2)
+
+    pair_idxs_a = [np.empty(0, dtype=np.int64)]
+    pair_idxs_b = [np.empty(0, dtype=np.int64)]
+    for t_idx_a, t_idx_b in unique_conflicts:
+        overlaps = _overlapping_start_times(
+            discrete_lengths[t_idx_a],
+            max_start_times[t_idx_a],
+            discrete_lengths[t_idx_b],
+            max_start_times[t_idx_b]
+        )
+        pair_idxs_a.append((
+            (t_idx_a*num_machines + machine_pairs[:, 0, None])
+            * num_start_times
+            + overlaps[None, :, 0]
+        ).ravel())
+        pair_idxs_b.append((
+            (t_idx_b*num_machines + machine_pairs[:, 1, None])
+            * num_start_times
+            + overlaps[None, :, 1]
+        ).ravel())
+    return np.concatenate(pair_idxs_a), np.concatenate(pair_idxs_b)
 
 
 def convert_to_qiskit(
@@ -161,11 +258,23 @@ def convert_to_qiskit(
     Returns:
         Representation of the problem as QUBO.
     """
-    linear = {a: val for (a, b), val in input.items() if a == b}
-    quadratic = {(a, b): val for (a, b), val in input.items() if a != b}
+    linear = {}
+    quadratic = {}
+    for (a, b), val in input.items():
+        if a == b:
+            linear[a] = val
+        else:
+            quadratic[(a, b)] = val
+
+    # Variables are registered in order of their linear terms, followed by
+    # variables that only occur in quadratic terms.
+    variables = dict.fromkeys(linear)
+    for a, b in quadratic:
+        variables.setdefault(a)
+        variables.setdefault(b)
 
     qubo = QuadraticProgram()
-    for var in linear.keys():
+    for var in variables:
         qubo.binary_var(var)
     qubo.minimize(constant=offset, linear=linear, quadratic=quadratic)
     return qubo
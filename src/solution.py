@@ -1,48 +1,105 @@
+import heapq
 import matplotlib.pyplot as plt
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from functools import cached_property
 from matplotlib.patches import Rectangle
 from typing import List, Iterable
 
 
-@dataclass
+@dataclass(frozen=True)
 class TransactionSolution:
     """Solution for one Transaction.
 
+    Transaction solutions are immutable and use slots.
+
     Attributes:
         id: Identifier/index of the transaction.
         start_time: Time when the transaction starts running on the machine.
         end_time: Time when the transaction completes running on the machine.
         duration: Duration of the transaction.
     """
+    __slots__ = ('id', 'start_time', 'end_time', 'duration')
+
     id: int
     start_time: float
     end_time: float
     duration: float
 
+    def __getstate__(self) -> tuple:
+        return tuple(getattr(self, name) for name in self.__slots__)
+
+    def __setstate__(self, state: tuple) -> None:
+        # Frozen dataclasses reject regular attribute assignment.
+        for name, value in zip(self.__slots__, state):
+            object.__setattr__(self, name, value)
+
 
 @dataclass
 class MachineSolution:
     """Solution for one Machine.
 
+    The transactions are stored as parallel lists (one per attribute of a
+    TransactionSolution) in order of their start times. New transactions are
+    added using `append`.
+
     Attributes:
-        transactions: Transactions running on this machine.
+        num_transactions: Number of transactions running on this machine.
+        processing_time: The first time point that this machine can work on a
+            new transaction.
+        ids: Identifiers/indices of the transactions running on this machine.
+        start_times: Start times of the transactions running on this machine.
+        end_times: End times of the transactions running on this machine.
+        durations: Durations of the transactions running on this machine.
     """
-    transactions: List[TransactionSolution]
+    num_transactions: int = field(default=0, init=False)
+    processing_time: float = field(default=0, init=False)
+    ids: List[int] = field(default_factory=list, init=False)
+    start_times: List[float] = field(default_factory=list, init=False)
+    end_times: List[float] = field(default_factory=list, init=False)
+    durations: List[float] = field(default_factory=list, init=False)
 
     @property
-    def processing_time(self) -> float:
-        """Processing time.
+    def transactions(self) -> List[TransactionSolution]:
+        """Transactions running on this machine.
 
-        The processing time is defined as the first time point that this
-        machine can work on a new transaction.
+        The list is built on every access. Therefore, changes to it do not
+        affect the machine.
 
         Returns:
-            The current processing time of the machine.
+            A new TransactionSolution object for each transaction.
+        """
+        return [
+            TransactionSolution(
+                id=id,
+                start_time=start_time,
+                end_time=end_time,
+                duration=duration
+            )
+            for id, start_time, end_time, duration in zip(
+                self.ids,
+                self.start_times,
+                self.end_times,
+                self.durations
+            )
+        ]
+
+    def append(self, id: int, start_time: float, duration: float) -> None:
+        """Add a transaction after the last transaction of this machine.
+
+        Args:
+            id: Identifier/index of the transaction.
+            start_time: Time when the transaction starts running on the
+                machine.
+            duration: Duration of the transaction.
         """
-        if len(self.transactions) == 0:
-            return 0
-        return self.transactions[-1].end_time
+        end_time = start_time + duration
+        self.ids.append(id)
+        self.start_times.append(start_time)
+        self.end_times.append(end_time)
+        self.durations.append(duration)
+        self.num_transactions += 1
+        self.processing_time = end_time
 
 
 @dataclass
@@ -60,7 +117,7 @@ class Solution:
     """
     machines: List[MachineSolution]
 
-    @property
+    @cached_property
     def length(self) -> float:
         """Length of the solution.
 
@@ -70,12 +127,7 @@ class Solution:
         Returns:
             The length of the solution.
         """
-        if hasattr(self, '_length'):
-            return self._length
-
-        lengths = [t.end_time for m in self.machines for t in m.transactions]
-        self._length = max(lengths)
-        return self._length
+        return max(m.processing_time for m in self.machines)
 
     def visualize(self) -> None:
         """Visualize the solution as a machine time diagram."""
@@ -104,25 +156,28 @@ class Solution:
         Returns:
             Solution order.
         """
-        num_transactions = sum(len(m.transactions) for m in self.machines)
-        # These machines are used to reconstruct the way the original machines
-        # were built.
-        machines = [MachineSolution([]) for _ in range(len(self.machines))]
+        num_transactions = sum(m.num_transactions for m in self.machines)
+        # Reconstructs the way the original machines were built by tracking
+        # the processing time of each machine in a heap. Ties are resolved by
+        # the machine index.
+        heap = [(0.0, machine_id) for machine_id in range(len(self.machines))]
+        heapq.heapify(heap)
         # Tracks the transaction index for the original machines to avoid
         # duplicating transactions.
-        index_tracker = {m: 0 for m in range(len(self.machines))}
+        index_tracker = [0]*len(self.machines)
 
         solution_order = []
         for _ in range(num_transactions):
-            machine = min(machines, key=lambda x: x.processing_time)
-            machine_id = machines.index(machine)
+            _, machine_id = heapq.heappop(heap)
 
-            transaction_id = index_tracker[machine_id]
-            transaction = self.machines[machine_id] \
-                .transactions[transaction_id]
+            machine = self.machines[machine_id]
+            transaction_idx = index_tracker[machine_id]
 
-            solution_order.append(transaction.id)
+            solution_order.append(machine.ids[transaction_idx])
 
-            machine.transactions.append(transaction)
+            heapq.heappush(
+                heap,
+                (machine.end_times[transaction_idx], machine_id)
+            )
             index_tracker[machine_id] += 1
         return solution_order
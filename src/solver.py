@@ -3,7 +3,7 @@ import time
 
 from dataclasses import dataclass
 from dwave.samplers import SimulatedAnnealingSampler
-from functools import wraps
+from functools import lru_cache, wraps
 from qiskit_optimization.algorithms import MinimumEigenOptimizer
 from qiskit_algorithms import NumPyMinimumEigensolver, QAOA, SamplingVQE
 from qiskit_algorithms.optimizers import COBYLA
@@ -40,13 +40,39 @@ def _measure_time(func: Callable) -> Callable:
     """
     @wraps(func)
     def wrapper(*args, **kwargs):
-        start = time.time()
+        start = time.perf_counter()
         res = func(*args, **kwargs)
-        end = time.time()
+        end = time.perf_counter()
         return res, end - start
     return wrapper
 
 
+@lru_cache(maxsize=None)
+def _get_cobyla() -> COBYLA:
+    """Get the classical optimizer shared by the variational solvers.
+
+    COBYLA keeps no state between optimizations and is therefore built once.
+    The sampler and the ansatz are mutated while solving and are built per
+    solve instead.
+
+    Returns:
+        COBYLA: Optimizer instance.
+    """
+    return COBYLA()
+
+
+@lru_cache(maxsize=None)
+def _get_exact_optimizer() -> MinimumEigenOptimizer:
+    """Get the optimizer used by `exact_solver`.
+
+    The optimizer is built once and reused for every QUBO.
+
+    Returns:
+        MinimumEigenOptimizer: Optimizer based on NumPyMinimumEigensolver.
+    """
+    return MinimumEigenOptimizer(NumPyMinimumEigensolver())
+
+
 @_measure_time
 def simulated_annealing_solver(
         qubo: Dict[Tuple[str, str], float],
@@ -89,7 +115,11 @@ def sampling_vqe_solver(
         energy including the offset.
     """
     ansatz = TwoLocal(rotation_blocks="ry", entanglement_blocks="cz")
-    svqe = SamplingVQE(sampler=Sampler(), ansatz=ansatz, optimizer=COBYLA())
+    svqe = SamplingVQE(
+        sampler=Sampler(),
+        ansatz=ansatz,
+        optimizer=_get_cobyla()
+    )
     opt = MinimumEigenOptimizer(svqe)
     quadratic_program = convert_to_qiskit(qubo, offset)
     result = opt.solve(quadratic_program)
@@ -113,7 +143,7 @@ def qaoa_solver(qubo: Dict[Tuple[str, str], float], offset: float) -> Result:
     """
     qaoa = QAOA(
         sampler=Sampler(),
-        optimizer=COBYLA(),
+        optimizer=_get_cobyla(),
         initial_point=[0.0, 0.0]
     )
     opt = MinimumEigenOptimizer(qaoa)
@@ -137,8 +167,7 @@ def exact_solver(qubo: Dict[Tuple[str, str], float], offset: float) -> Result:
         Result object containing the best variables that are activated and the
         energy including the offset.
     """
-    exact = NumPyMinimumEigensolver()
-    opt = MinimumEigenOptimizer(exact)
+    opt = _get_exact_optimizer()
     quadratic_program = convert_to_qiskit(qubo, offset)
     result = opt.solve(quadratic_program)
     return Result(
@@ -1,9 +1,10 @@
+import heapq
 import numpy as np
 
 from dataclasses import dataclass
 from src.solution import MachineSolution, Solution
 from src.utils import build_transaction_solution
-from typing import Iterable, Optional
+from typing import Iterable, List, Optional, Set
 
 
 @dataclass
@@ -34,6 +35,28 @@ class TransactionScheduleTask:
         """
         return len(self.lengths)
 
+    @property
+    def conflicting_transactions(self) -> List[Set[int]]:
+        """Getter for the conflicting transactions of each transaction.
+
+        The conflicts are stored as a set of neighbors per transaction, which
+        allows to test whether two transactions conflict with a single set
+        lookup. In order to reduce calculation costs, the sets are lazy
+        loaded.
+
+        Returns:
+            List containing the ids of the conflicting transactions per
+                transaction.
+        """
+        if hasattr(self, '_conflicting_transactions'):
+            return self._conflicting_transactions
+
+        self._conflicting_transactions = [
+            set(np.flatnonzero(self.conflicts[:, transaction_id]).tolist())
+            for transaction_id in range(self.num_transactions)
+        ]
+        return self._conflicting_transactions
+
     @property
     def optimal_solution(self) -> Solution:
         """Getter for the representation of the optimal Solution.
@@ -70,8 +93,8 @@ class TransactionScheduleTask:
         if lengths is None:
             lengths = self.lengths
 
-        medium_execution_time = lengths.sum() / self.num_machines
-        max_transaction_length = lengths.max()
+        medium_execution_time = float(lengths.sum()) / self.num_machines
+        max_transaction_length = float(lengths.max())
         execution_time = max(medium_execution_time, max_transaction_length)
         return execution_time
 
@@ -88,11 +111,16 @@ class TransactionScheduleTask:
         Returns:
             Solution: Solution generated from the given order.
         """
-        machines = [MachineSolution([]) for _ in range(self.num_machines)]
+        machines = [MachineSolution() for _ in range(self.num_machines)]
+        # Processing time of each machine. Ties are resolved by the machine
+        # index.
+        heap = [(0.0, machine_id) for machine_id in range(self.num_machines)]
+        heapq.heapify(heap)
 
         for transaction_id in solution_order:
             # Find machine with lowest processing time.
-            machine = min(machines, key=lambda x: x.processing_time)
+            _, machine_id = heapq.heappop(heap)
+            machine = machines[machine_id]
             duration = self.lengths[transaction_id]
 
             build_transaction_solution(
@@ -100,7 +128,9 @@ class TransactionScheduleTask:
                 machines=machines,
                 transaction_id=transaction_id,
                 duration=duration,
-                conflicts=self.conflicts
+                conflicting_transactions=self.conflicting_transactions[
+                    transaction_id]
             )
+            heapq.heappush(heap, (machine.processing_time, machine_id))
 
         return Solution(machines=machines)
@@ -1,3 +1,5 @@
+import heapq
+
 from collections import defaultdict
 from src.solution import Solution, MachineSolution
 from src.task import TransactionScheduleTask
@@ -10,17 +12,21 @@ def binary_variables_to_solution(
         vars: Iterable[str],
         task: TransactionScheduleTask
         ) -> Solution:
-    representations = [VariableRepresentation.from_string(var) for var in vars]
-    machines = [MachineSolution([]) for _ in range(task.num_machines)]
+    representations = VariableRepresentation.from_strings(vars)
+    machines = [MachineSolution() for _ in range(task.num_machines)]
 
     machine_var_map = defaultdict(list)
     [machine_var_map[rep.machine_id].append(rep) for rep in representations]
     {k: sorted(v, key=lambda x: x.start_time)
      for k, v in machine_var_map.items()}
 
+    # Processing time of each machine. Ties are resolved by the machine index.
+    heap = [(0.0, machine_id) for machine_id in range(task.num_machines)]
+    heapq.heapify(heap)
+
     for _ in range(task.num_transactions):
-        machine = min(machines, key=lambda x: x.processing_time)
-        machine_id = machines.index(machine)
+        _, machine_id = heapq.heappop(heap)
+        machine = machines[machine_id]
 
         transaction_var = machine_var_map[machine_id].pop()
         transaction_id = transaction_var.transaction_id
@@ -31,8 +37,10 @@ def binary_variables_to_solution(
             machines=machines,
             transaction_id=transaction_id,
             duration=duration,
-            conflicts=task.conflicts
+            conflicting_transactions=task.conflicting_transactions[
+                transaction_id]
         )
+        heapq.heappush(heap, (machine.processing_time, machine_id))
 
     return Solution(machines=machines)
 
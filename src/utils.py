@@ -1,7 +1,5 @@
-import numpy as np
-
-from src.solution import MachineSolution, TransactionSolution
-from typing import List
+from src.solution import MachineSolution
+from typing import List, Set
 
 
 def build_transaction_solution(
@@ -9,9 +7,9 @@ def build_transaction_solution(
         machines: List[MachineSolution],
         transaction_id: int,
         duration: float,
-        conflicts: np.ndarray
+        conflicting_transactions: Set[int]
         ) -> None:
-    """Creates a new TransactionSolution and adds it to the machine.
+    """Schedules a new transaction on the machine.
 
     We ensure that no conflicting transactions run at the same time and that no
     two transactions run at the same time on the same machine.
@@ -21,32 +19,68 @@ def build_transaction_solution(
         machines: All machines.
         transaction_id: Id of the transaction to execute.
         duration: Execution time of the transaction.
-        conflicts: 2D-Array containing the conflicts between transactions.
+        conflicting_transactions: Ids of the transactions that conflict with
+            the transaction to execute.
     """
-    if len(machine.transactions) > 0:
-        earliest_possible = machine.transactions[-1].end_time
-    else:
-        earliest_possible = 0
+    earliest_possible = machine.processing_time
 
     # For every other machine, check that no other conflicting
     # transaction is running after earliest_possible, otherwise postpone
-    # execution of the current transaction.
-    for other_machine in machines:
-        if id(other_machine) != id(machine):
-            for omt in other_machine.transactions:
-                # Check that a conflict exist and whether their time
-                # windows are overlapping.
-                if conflicts[omt.id][transaction_id] > 0 \
-                        and omt.start_time <= earliest_possible + duration \
-                        and omt.end_time >= earliest_possible:
-                    earliest_possible = max(
-                        omt.end_time,
-                        earliest_possible
-                    )
-
-    machine.transactions.append(TransactionSolution(
+    # execution of the current transaction. The transactions are checked in
+    # order as each postponement affects the checks of the following ones.
+    if len(conflicting_transactions) > 0:
+        start_times = []
+        end_times = []
+        for other_machine in machines:
+            if other_machine is machine:
+                continue
+            for omt_id, start_time, end_time in zip(
+                    other_machine.ids,
+                    other_machine.start_times,
+                    other_machine.end_times):
+                if omt_id in conflicting_transactions:
+                    start_times.append(start_time)
+                    end_times.append(end_time)
+
+        earliest_possible = _postpone_start_time(
+            earliest_possible=earliest_possible,
+            duration=duration,
+            start_times=start_times,
+            end_times=end_times
+        )
+
+    machine.append(
         id=transaction_id,
         start_time=earliest_possible,
-        end_time=earliest_possible + duration,
         duration=duration
-    ))
+    )
+
+
+def _postpone_start_time(
+        earliest_possible: float,
+        duration: float,
+        start_times: List[float],
+        end_times: List[float]
+        ) -> float:
+    """Postpone a start time until no given transaction overlaps.
+
+    The transactions are checked in a single pass in order. Whenever a
+    transaction overlaps with the current time window, the start time is
+    postponed to its end time, which affects the checks of the following
+    transactions.
+
+    Args:
+        earliest_possible: Earliest possible start time.
+        duration: Execution time of the transaction to start.
+        start_times: Start times of the conflicting transactions.
+        end_times: End times of the conflicting transactions.
+
+    Returns:
+        Postponed start time.
+    """
+    for start_time, end_time in zip(start_times, end_times):
+        # Check whether the time windows are overlapping.
+        if start_time <= earliest_possible + duration \
+                and end_time >= earliest_possible:
+            earliest_possible = max(end_time, earliest_possible)
+    return earliest_possible
@@ -1,4 +1,5 @@
 from dataclasses import dataclass
+from typing import Iterable, List
 
 @dataclass
 class VariableRepresentation:
@@ -28,9 +29,30 @@ class VariableRepresentation:
         Returns:
             VariableRepresentation object.
         """
-        splits = input.split('-')
+        transaction_id, machine_id, start_time = input.split('-', 2)
         return cls(
-            transaction_id=int(splits[0])-1,
-            machine_id=int(splits[1])-1,
-            start_time=int(splits[2])
+            transaction_id=int(transaction_id)-1,
+            machine_id=int(machine_id)-1,
+            start_time=int(start_time)
         )
+
+    @classmethod
+    def from_strings(
+            cls,
+            inputs: Iterable[str]
+            ) -> List["VariableRepresentation"]:
+        """Initialize VariableRepresentations from multiple strings.
+
+        See `from_string` for the expected format of each string.
+
+        Args:
+            inputs: Strings to use.
+
+        Returns:
+            List containing a VariableRepresentation object per string.
+        """
+        splits = [input.split('-', 2) for input in inputs]
+        return [
+            cls(int(transaction_id)-1, int(machine_id)-1, int(start_time))
+            for transaction_id, machine_id, start_time in splits
+        ]